@@ -92,15 +92,17 @@ class DB:
         return [Player.get_from_dict(player) for player in players]
 
     def load_club_objects(self, clubs: list[dict], players: list[dict]) -> list[Club]:
+        squads = self.load_squads_file()
         _clubs = []
         for club in clubs:
+            squad_ids = set(club["squad"])
             players_ = [
                 Player.get_from_dict(player)
                 for player in players
-                if player["id"] in club["squad"]
+                if player["id"] in squad_ids
             ]
             squad = self.get_player_team_from_dicts(
-                self.load_club_squads(club["id"]), players_
+                self.load_club_squads(club["id"], squads), players_
             )
             _clubs.append(Club.get_from_dict(club, squad))
 
@@ -140,12 +142,12 @@ class DB:
     def get_player_team_from_dicts(
         self, squads_dict: list[dict], players: list[Player]
     ) -> list[PlayerTeam]:
+        players_by_id = {player.player_id.int: player for player in players}
         squad = []
-        for playerteam_dict in squads_dict:
-            for player in players:
-                if player.player_id.int == playerteam_dict["player_id"]:
-                    squad.append(PlayerTeam.get_from_dict(playerteam_dict, players))
-                    break
+        if players_by_id:
+            for playerteam_dict in squads_dict:
+                if player := players_by_id.get(playerteam_dict["player_id"]):
+                    squad.append(PlayerTeam.get_from_dict(playerteam_dict, [player]))
 
         if not squad:
             raise PlayerTeamLoadError("Squad not found in database of players!")
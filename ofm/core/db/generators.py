@@ -178,8 +178,9 @@ class PlayerGenerator(Generator):
 
         self.players_obj: List[Player] = []
         self.settings = settings
-        self.nationalities = self._get_nationalities()
+        self.attr_gen = PlayerAttributeGenerator(max_skill_lvl)
         self.names = self._get_names()
+        self.nationalities = self._get_nationalities()
 
         year = timedelta(seconds=31556952)  # definition of a Gregorian calendar date
         self.today = today
@@ -188,9 +189,7 @@ class PlayerGenerator(Generator):
         self.max_skill_lvl = max_skill_lvl
 
     def _get_nationalities(self):
-        with open(self.settings.names_file, "r", encoding="utf-8") as fp:
-            data = json.load(fp)
-            return [d["region"] for d in data]
+        return [d["region"] for d in self.names]
 
     def _get_names(self):
         with open(self.settings.names_file, "r", encoding="utf-8") as fp:
@@ -330,7 +329,6 @@ class PlayerGenerator(Generator):
         sigma: Optional[int] = 20,
         desired_pos: Optional[List[Positions]] = None,
     ) -> Player:
-        attr_gen = PlayerAttributeGenerator(self.max_skill_lvl)
         player_id = self.generate_id()
         nationality = self.generate_nationality(region)
         first_name, last_name, short_name = self.generate_name(region)
@@ -338,13 +336,12 @@ class PlayerGenerator(Generator):
         age = int((self.today - dob).days * 0.0027379070)
         positions = self.generate_positions(desired_pos)
         preferred_foot = self.generate_preferred_foot()
-        attributes = attr_gen.generate(positions, mu, sigma)
+        attributes = self.attr_gen.generate(positions, mu, sigma)
         potential_skill = self.generate_potential_skill(attributes, positions, age)
-        international_reputation = self.generate_international_reputation(
-            attributes.get_overall(positions[0]),
-        )
+        overall = attributes.get_overall(positions[0])
+        international_reputation = self.generate_international_reputation(overall)
         value = self.generate_player_value(
-            attributes.get_overall(positions[0]),
+            overall,
             age,
             potential_skill,
             international_reputation,
@@ -435,14 +432,11 @@ class TeamGenerator(Generator):
         bonus_for_goal = 0
         bonus_for_def = 0
         position = player.get_best_position()
+        overall = player.attributes.get_overall(position)
         if any(x in player.positions for x in [Positions.FW, Positions.MF]):
-            bonus_for_goal = player.value * (
-                (player.attributes.get_overall(position) / 2) / 100
-            )
+            bonus_for_goal = player.value * ((overall / 2) / 100)
         if any(x in player.positions for x in [Positions.GK, Positions.DF]):
-            bonus_for_def = player.value * (
-                (player.attributes.get_overall(position) / 2) / 100
-            )
+            bonus_for_def = player.value * ((overall / 2) / 100)
 
         return PlayerContract(
             wage, contract_started, contract_end, bonus_for_goal, bonus_for_def
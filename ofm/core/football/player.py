@@ -115,7 +115,7 @@ class Player:
         return cls(
             UUID(int=player_dict["id"]),
             player_dict["nationality"],
-            datetime.datetime.strptime(player_dict["dob"], "%Y-%m-%d").date(),
+            datetime.date.fromisoformat(player_dict["dob"]),
             player_dict["first_name"],
             player_dict["last_name"],
             player_dict["short_name"],
@@ -14,7 +14,7 @@
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 
 
 @dataclass
@@ -29,8 +29,8 @@ class PlayerContract:
     def get_from_dict(cls, contract: dict):
         return cls(
             contract["wage"],
-            datetime.strptime(contract["started"], "%Y-%m-%d").date(),
-            datetime.strptime(contract["end"], "%Y-%m-%d").date(),
+            date.fromisoformat(contract["started"]),
+            date.fromisoformat(contract["end"]),
             contract["bonus_for_goal"],
             contract["bonus_for_def"],
         )
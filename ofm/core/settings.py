@@ -29,16 +29,17 @@ class Settings:
         settings: Union[str, Path] = os.path.join(PROJECT_DIR, "settings.yaml"),
     ) -> None:
         self.root_dir = root_dir
-        self.res: Path = Path(os.path.join(root_dir, "res"))
-        self.images: Path = Path(os.path.join(root_dir, "images"))
-        self.db: Path = Path(os.path.join(self.res, "db"))
-        self.save: Path = Path(os.path.join(root_dir, "save"))
-        self.clubs_def: Path = Path(os.path.join(self.res, "clubs_def.json"))
-        self.fifa_codes: Path = Path(os.path.join(self.res, "fifa_country_codes.json"))
-        self.fifa_conf: Path = Path(os.path.join(self.res, "fifa_confederations.json"))
-        self.squads_file: Path = Path(os.path.join(self.db, "squads.json"))
-        self.players_file: Path = Path(os.path.join(self.db, "players.json"))
-        self.clubs_file: Path = Path(os.path.join(self.db, "clubs.json"))
+        root = Path(root_dir)
+        self.res: Path = root / "res"
+        self.images: Path = root / "images"
+        self.db: Path = self.res / "db"
+        self.save: Path = root / "save"
+        self.clubs_def: Path = self.res / "clubs_def.json"
+        self.fifa_codes: Path = self.res / "fifa_country_codes.json"
+        self.fifa_conf: Path = self.res / "fifa_confederations.json"
+        self.squads_file: Path = self.db / "squads.json"
+        self.players_file: Path = self.db / "players.json"
+        self.clubs_file: Path = self.db / "clubs.json"
         self.names_file: Path = Path(NAMES_FILE)
         self.settings_file: Path = Path(settings)
 
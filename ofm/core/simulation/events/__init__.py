@@ -14,7 +14,7 @@
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import random
-from copy import deepcopy
+from copy import copy
 from typing import Optional
 
 from ...football.team_simulation import TeamSimulation
@@ -33,6 +33,33 @@ from .pass_event import PassEvent
 from .penalty_kick_event import PenaltyKickEvent
 from .shot_event import ShotEvent
 
+_EVENT_CLASSES = {
+    EventType.PASS: PassEvent,
+    EventType.DRIBBLE: DribbleEvent,
+    EventType.FOUL: FoulEvent,
+    EventType.SHOT: ShotEvent,
+    EventType.CROSS: CrossEvent,
+    EventType.CORNER_KICK: CornerKickEvent,
+    EventType.FREE_KICK: FreeKickEvent,
+    EventType.GOAL_KICK: GoalKickEvent,
+    EventType.PENALTY_KICK: PenaltyKickEvent,
+}
+
+_KICKOFF_STATUSES = frozenset(
+    {
+        SimulationStatus.NOT_STARTED,
+        SimulationStatus.FIRST_HALF_BREAK,
+        SimulationStatus.SECOND_HALF_BREAK,
+        SimulationStatus.FIRST_HALF_EXTRA_TIME_BREAK,
+    }
+)
+_CORNER_KICK_OUTCOMES = frozenset(
+    {
+        EventOutcome.SHOT_LEFT_CORNER_KICK,
+        EventOutcome.SHOT_RIGHT_CORNER_KICK,
+    }
+)
+
 
 class EventFactory:
     def get_event_type(
@@ -41,22 +68,14 @@ class EventFactory:
         state: GameState,
         last_event: Optional[SimulationEvent],
     ) -> EventType:
-        if state.status in [
-            SimulationStatus.NOT_STARTED,
-            SimulationStatus.FIRST_HALF_BREAK,
-            SimulationStatus.SECOND_HALF_BREAK,
-            SimulationStatus.FIRST_HALF_EXTRA_TIME_BREAK,
-        ]:
+        if state.status in _KICKOFF_STATUSES:
             return EventType.PASS
 
         if last_event.outcome == EventOutcome.GOAL:
             return EventType.PASS
         elif last_event.outcome == EventOutcome.SHOT_GOAL_KICK:
             return EventType.GOAL_KICK
-        elif last_event.outcome in [
-            EventOutcome.SHOT_LEFT_CORNER_KICK,
-            EventOutcome.SHOT_RIGHT_CORNER_KICK,
-        ]:
+        elif last_event.outcome in _CORNER_KICK_OUTCOMES:
             return EventType.CORNER_KICK
         elif isinstance(last_event, FoulEvent):
             if (
@@ -82,24 +101,9 @@ class EventFactory:
         return random.choices(events, transition_matrix)[0]
 
     def get_event(self, _state: GameState, event_type: EventType) -> SimulationEvent:
-        state = deepcopy(_state)
-        if event_type == EventType.PASS:
-            return PassEvent(EventType.PASS, state)
-        elif event_type == EventType.DRIBBLE:
-            return DribbleEvent(EventType.DRIBBLE, state)
-        elif event_type == EventType.FOUL:
-            return FoulEvent(EventType.FOUL, state)
-        elif event_type == EventType.SHOT:
-            return ShotEvent(EventType.SHOT, state)
-        elif event_type == EventType.CROSS:
-            return CrossEvent(EventType.CROSS, state)
-        elif event_type == EventType.CORNER_KICK:
-            return CornerKickEvent(EventType.CORNER_KICK, state)
-        elif event_type == EventType.FREE_KICK:
-            return FreeKickEvent(EventType.FREE_KICK, state)
-        elif event_type == EventType.GOAL_KICK:
-            return GoalKickEvent(EventType.GOAL_KICK, state)
-        elif event_type == EventType.PENALTY_KICK:
-            return PenaltyKickEvent(EventType.PENALTY_KICK, state)
+        event_class = _EVENT_CLASSES.get(event_type)
+        if event_class is None:
+            return NotImplemented
 
-        return NotImplemented
+        state = copy(_state)
+        return event_class(event_type, state)
@@ -26,6 +26,49 @@ from .events import EventFactory
 from .fixture import Fixture
 from .game_state import GameState, SimulationStatus
 
+_STARTING_TEAM_KICKOFF = frozenset(
+    {
+        SimulationStatus.NOT_STARTED,
+        SimulationStatus.SECOND_HALF_BREAK,
+    }
+)
+_SECONDARY_TEAM_KICKOFF = frozenset(
+    {
+        SimulationStatus.FIRST_HALF_BREAK,
+        SimulationStatus.FIRST_HALF_EXTRA_TIME_BREAK,
+    }
+)
+
+
+_FIRST_HALF_END = timedelta(minutes=45)
+_SECOND_HALF_END = timedelta(minutes=90)
+_FIRST_HALF_EXTRA_TIME_END = timedelta(minutes=105)
+_SECOND_HALF_EXTRA_TIME_END = timedelta(minutes=120)
+
+_PERIOD_END = {
+    SimulationStatus.FIRST_HALF: _FIRST_HALF_END,
+    SimulationStatus.SECOND_HALF: _SECOND_HALF_END,
+    SimulationStatus.FIRST_HALF_EXTRA_TIME: _FIRST_HALF_EXTRA_TIME_END,
+    SimulationStatus.SECOND_HALF_EXTRA_TIME: _SECOND_HALF_EXTRA_TIME_END,
+}
+
+
+def calculate_added_time(
+    state: GameState, rng: Optional[random.Random] = None
+) -> Optional[timedelta]:
+    """
+    Returns the added time drawn from rng if the state is at the end of a period and
+    added time has not started yet. Otherwise, returns None. The state is not modified.
+
+    If no rng is given, the random module is used.
+    """
+    randint = random.randint if rng is None else rng.randint
+    if state.in_additional_time is False and state.minutes == _PERIOD_END.get(
+        state.status
+    ):
+        return timedelta(minutes=float(randint(0, 5)))
+    return None
+
 
 class DelayValue(Enum):
     NONE = 0
@@ -87,31 +130,10 @@ class LiveGame:
         self.engine.state = state
 
     def get_added_time(self):
-        if (
-            (
-                self.state.status == SimulationStatus.FIRST_HALF
-                and self.state.in_additional_time is False
-                and self.state.minutes == timedelta(minutes=45)
-            )
-            or (
-                self.state.status == SimulationStatus.SECOND_HALF
-                and self.state.in_additional_time is False
-                and self.state.minutes == timedelta(minutes=90)
-            )
-            or (
-                self.state.status == SimulationStatus.FIRST_HALF_EXTRA_TIME
-                and self.state.in_additional_time is False
-                and self.state.minutes == timedelta(minutes=105)
-            )
-            or (
-                self.state.status == SimulationStatus.SECOND_HALF_EXTRA_TIME
-                and self.state.in_additional_time is False
-                and self.state.minutes == timedelta(minutes=120)
-            )
-        ):
-            added_time = random.randint(0, 5)
+        added_time = calculate_added_time(self.state)
+        if added_time is not None:
             self.state.in_additional_time = True
-            self.added_time = timedelta(minutes=float(added_time))
+            self.added_time = added_time
 
     def calculate_attendance(self) -> int:
         pass
@@ -125,7 +147,7 @@ class LiveGame:
             self.state.status = SimulationStatus.FIRST_HALF
         elif (
             self.state.status == SimulationStatus.FIRST_HALF
-            and self.state.minutes == timedelta(minutes=45)
+            and self.state.minutes == _FIRST_HALF_END
         ):
             if not self.state.in_additional_time:
                 self.get_added_time()
@@ -139,7 +161,7 @@ class LiveGame:
             self.state.status = SimulationStatus.SECOND_HALF
         elif (
             self.state.status == SimulationStatus.SECOND_HALF
-            and self.state.minutes == timedelta(minutes=90)
+            and self.state.minutes == _SECOND_HALF_END
         ):
             if not self.state.in_additional_time:
                 self.get_added_time()
@@ -157,7 +179,7 @@ class LiveGame:
             self.state.status = SimulationStatus.FIRST_HALF_EXTRA_TIME
         elif (
             self.state.status == SimulationStatus.FIRST_HALF_EXTRA_TIME
-            and self.state.minutes == timedelta(minutes=105)
+            and self.state.minutes == _FIRST_HALF_EXTRA_TIME_END
         ):
             if not self.state.in_additional_time:
                 self.get_added_time()
@@ -171,7 +193,7 @@ class LiveGame:
             self.state.status = SimulationStatus.SECOND_HALF_EXTRA_TIME
         elif (
             self.state.status == SimulationStatus.SECOND_HALF_EXTRA_TIME
-            and self.state.minutes == timedelta(minutes=120)
+            and self.state.minutes == _SECOND_HALF_EXTRA_TIME_END
         ):
             if not self.state.in_additional_time:
                 self.get_added_time()
@@ -192,34 +214,11 @@ class LiveGame:
         self.state.minutes += duration
         self.total_elapsed_time += duration
 
-        if (
-            self.state.minutes >= timedelta(minutes=45)
-            and self.state.status == SimulationStatus.FIRST_HALF
-        ):
-            additional_time = self.state.minutes - timedelta(minutes=45)
-            self.state.additional_time_elapsed += additional_time
-            self.state.minutes = timedelta(minutes=45)
-        elif (
-            self.state.minutes >= timedelta(minutes=90)
-            and self.state.status == SimulationStatus.SECOND_HALF
-        ):
-            additional_time = self.state.minutes - timedelta(minutes=90)
-            self.state.additional_time_elapsed += additional_time
-            self.state.minutes = timedelta(minutes=90)
-        elif (
-            self.state.minutes >= timedelta(minutes=105)
-            and self.state.status == SimulationStatus.FIRST_HALF_EXTRA_TIME
-        ):
-            additional_time = self.state.minutes - timedelta(minutes=105)
-            self.state.additional_time_elapsed += additional_time
-            self.state.minutes = timedelta(minutes=105)
-        elif (
-            self.state.minutes >= timedelta(minutes=120)
-            and self.state.status == SimulationStatus.SECOND_HALF_EXTRA_TIME
-        ):
-            additional_time = self.state.minutes - timedelta(minutes=120)
+        period_end = _PERIOD_END.get(self.state.status)
+        if period_end is not None and self.state.minutes >= period_end:
+            additional_time = self.state.minutes - period_end
             self.state.additional_time_elapsed += additional_time
-            self.state.minutes = timedelta(minutes=120)
+            self.state.minutes = period_end
 
     def is_game_on_break(self) -> bool:
         return (
@@ -284,10 +283,7 @@ class SimulationEngine:
         """
         Returns (Attacking Team, Defending Team)
         """
-        if self.state.status in [
-            SimulationStatus.NOT_STARTED,
-            SimulationStatus.SECOND_HALF_BREAK,
-        ]:
+        if self.state.status in _STARTING_TEAM_KICKOFF:
             self.starting_the_game.in_possession = True
             self.secondary_start.in_possession = False
             self.starting_the_game.player_in_possession = (
@@ -295,10 +291,7 @@ class SimulationEngine:
                     PitchPosition.MIDFIELD_CENTER
                 )
             )
-        elif self.state.status in [
-            SimulationStatus.FIRST_HALF_BREAK,
-            SimulationStatus.FIRST_HALF_EXTRA_TIME_BREAK,
-        ]:
+        elif self.state.status in _SECONDARY_TEAM_KICKOFF:
             self.starting_the_game.in_possession = False
             self.secondary_start.in_possession = True
             self.secondary_start.player_in_possession = (
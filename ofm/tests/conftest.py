@@ -13,22 +13,39 @@
 #
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import copy
 import datetime
 import json
 import uuid
+from typing import TYPE_CHECKING
 
 import pytest
 
-from ..core.db.generators import PlayerGenerator, TeamGenerator
-from ..core.football.club import PlayerTeam
-from ..core.football.formation import Formation
-from ..core.football.player import Player, PlayerInjury, PlayerSimulation, PreferredFoot
-from ..core.football.player_attributes import *
-from ..core.football.playercontract import PlayerContract
-from ..core.football.team_simulation import TeamSimulation
-from ..core.settings import Settings
-from ..core.simulation.simulation import Fixture, LiveGame, SimulationEngine
-from ..defaults import PROJECT_DIR
+from ofm.core.db.generators import PlayerGenerator, TeamGenerator
+from ofm.core.football.club import PlayerTeam
+from ofm.core.football.player import (
+    Player,
+    PlayerInjury,
+    PlayerSimulation,
+    PreferredFoot,
+)
+from ofm.core.football.player_attributes import (
+    DefensiveAttributes,
+    GkAttributes,
+    IntelligenceAttributes,
+    OffensiveAttributes,
+    PhysicalAttributes,
+    PlayerAttributes,
+)
+from ofm.core.football.playercontract import PlayerContract
+from ofm.core.football.positions import Positions
+from ofm.core.settings import Settings
+from ofm.defaults import PROJECT_DIR
+
+if TYPE_CHECKING:
+    from ofm.core.football.club import Club
+    from ofm.core.football.team_simulation import TeamSimulation
+    from ofm.core.simulation.simulation import LiveGame
 
 
 @pytest.fixture
@@ -136,8 +153,7 @@ def player_sim(player_team: tuple[PlayerTeam, Player, dict]) -> PlayerSimulation
     return PlayerSimulation(player_team[0], position)
 
 
-@pytest.fixture
-def squads_def() -> list[dict]:
+def get_squads_def() -> list[dict]:
     return [
         {
             "name": "Munchen",
@@ -166,6 +182,11 @@ def squads_def() -> list[dict]:
     ]
 
 
+@pytest.fixture
+def squads_def() -> list[dict]:
+    return get_squads_def()
+
+
 @pytest.fixture
 def mock_file() -> list[dict]:
     return [
@@ -192,20 +213,24 @@ def mock_file() -> list[dict]:
     ]
 
 
-@pytest.fixture
-def confederations_file(settings: Settings) -> list[dict]:
-    with open(settings.fifa_conf, "r") as fp:
+@pytest.fixture(scope="module")
+def confederations_file() -> list[dict]:
+    with open(Settings().fifa_conf, "r") as fp:
         return json.load(fp)
 
 
+@pytest.fixture(scope="module")
+def simulation_clubs(confederations_file) -> list["Club"]:
+    team_gen = TeamGenerator(get_squads_def(), confederations_file, Settings())
+    return team_gen.generate()
+
+
 @pytest.fixture
-def simulation_teams(
-    squads_def, confederations_file, settings: Settings
-) -> tuple[TeamSimulation, TeamSimulation]:
-    team_gen = TeamGenerator(squads_def, confederations_file, settings)
+def simulation_teams(simulation_clubs) -> tuple["TeamSimulation", "TeamSimulation"]:
+    from ofm.core.football.formation import Formation
+    from ofm.core.football.team_simulation import TeamSimulation
 
-    teams = team_gen.generate()
-    home_team, away_team = teams[0], teams[1]
+    home_team, away_team = copy.deepcopy(simulation_clubs[:2])
 
     home_team_formation = Formation(home_team.default_formation)
     home_team_formation.get_best_players(home_team.squad)
@@ -223,7 +248,9 @@ class MockSimulationEngine:
 
 
 @pytest.fixture
-def live_game(monkeypatch, simulation_teams) -> LiveGame:
+def live_game(monkeypatch, simulation_teams) -> "LiveGame":
+    from ofm.core.simulation.simulation import Fixture, LiveGame, SimulationEngine
+
     def get_simulation_engine(*args, **kwargs):
         return MockSimulationEngine()
 
@@ -231,8 +258,8 @@ def live_game(monkeypatch, simulation_teams) -> LiveGame:
     home_team = home_team_sim.club
     away_team = away_team_sim.club
     fixture = Fixture(
-        uuid.uuid4(),
-        uuid.uuid4(),
+        uuid.UUID(int=1),
+        uuid.UUID(int=2),
         home_team.club_id,
         away_team.club_id,
         home_team.stadium,
@@ -15,7 +15,7 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import json
 import uuid
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 import pytest
 
@@ -33,6 +33,11 @@ def db(settings, confederations_file) -> DB:
     return DB(settings)
 
 
+@pytest.fixture(scope="module")
+def module_player_gen() -> PlayerGenerator:
+    return PlayerGenerator(Settings())
+
+
 def test_generate_players(db: DB):
     expected_players = db.generate_players()
     file_contents = db.load_players()
@@ -40,6 +45,28 @@ def test_generate_players(db: DB):
     assert expected_players == file_contents
 
 
+def test_load_players_returns_fresh_list(db: DB):
+    expected_players = db.generate_players(amount=5)
+    db.load_players().clear()
+    assert db.load_players() == expected_players
+
+
+def test_load_club_objects_reads_squads_file_once(db: DB, squads_def, monkeypatch):
+    db.generate_teams_and_squads(squads_def)
+    clubs_dict = db.load_clubs()
+    players_dict = db.load_players()
+    load_squads_file = db.load_squads_file
+    calls = []
+
+    def counting_load_squads_file():
+        calls.append(None)
+        return load_squads_file()
+
+    monkeypatch.setattr(db, "load_squads_file", counting_load_squads_file)
+    db.load_club_objects(clubs_dict, players_dict)
+    assert len(calls) == 1
+
+
 def test_get_non_existent_player_from_database(db: DB):
     with pytest.raises(DatabaseLoadError):
         db.get_player_object_from_id(uuid.uuid4(), [{"id": uuid.uuid4().int}])
@@ -50,26 +77,32 @@ def test_get_player_from_empty_players_list(db: DB):
         db.get_player_object_from_id(uuid.uuid4(), [])
 
 
-def test_get_player_from_player_list(db: DB):
-    player = PlayerGenerator(db.settings).generate_player()
+def test_get_player_from_player_list(db: DB, module_player_gen: PlayerGenerator):
+    player = module_player_gen.generate_player()
     player_dict = player.serialize()
     pl_id = player.player_id
     assert db.get_player_object_from_id(pl_id, [player_dict]) == player
 
 
-def test_load_player_from_dict(db: DB):
-    player = PlayerGenerator(db.settings).generate_player()
+def test_load_player_from_dict(db: DB, module_player_gen: PlayerGenerator):
+    player = module_player_gen.generate_player()
     player_dict = player.serialize()
     assert db.load_player_objects([player_dict]) == [player]
 
 
 def test_raises_database_load_error_get_player_team_from_dict(db: DB):
-    players = [Mock(player_id=uuid.uuid4())]
+    players = [SimpleNamespace(player_id=uuid.uuid4())]
     squad_ids = [{"player_id": uuid.uuid4().int}]
     with pytest.raises(PlayerTeamLoadError):
         db.get_player_team_from_dicts(squad_ids, players)
 
 
+def test_get_player_team_from_dict_without_player_id_raises(db: DB, player_obj):
+    squad_ids = [{"id": uuid.uuid4().int}]
+    with pytest.raises(KeyError):
+        db.get_player_team_from_dicts(squad_ids, [player_obj])
+
+
 def test_raises_error_get_player_team_from_dict(db: DB):
     players = []
     squad_ids = [{"id": uuid.uuid4().int}]
@@ -13,9 +13,6 @@
 #
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
-import os
-from pathlib import Path
-
 from ofm.core.settings import Settings
 from ofm.defaults import NAMES_FILE
 
@@ -29,9 +26,9 @@ def test_get_settings(settings: Settings):
         "clubs_def": str(settings.clubs_def),
         "fifa_codes": str(settings.fifa_codes),
         "fifa_conf": str(settings.fifa_conf),
-        "squads": os.path.join(settings.db, "squads.json"),
-        "players": os.path.join(settings.db, "players.json"),
-        "clubs": os.path.join(settings.db, "clubs.json"),
+        "squads": str(settings.db / "squads.json"),
+        "players": str(settings.db / "players.json"),
+        "clubs": str(settings.db / "clubs.json"),
         "names": NAMES_FILE,
     }
     settings.create_settings()
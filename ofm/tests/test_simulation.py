@@ -13,13 +13,17 @@
 #
 #      You should have received a copy of the GNU General Public License
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import random
+from copy import copy
 from datetime import timedelta
 
+import pytest
+
 from ofm.core.simulation import PitchPosition
 from ofm.core.simulation.event_type import EventType
 from ofm.core.simulation.events import EventFactory, PassEvent
 from ofm.core.simulation.game_state import GameState, SimulationStatus
-from ofm.core.simulation.simulation import LiveGame
+from ofm.core.simulation.simulation import LiveGame, calculate_added_time
 
 
 def test_formations_are_complete(live_game: LiveGame):
@@ -34,15 +38,6 @@ def test_penalty_shootout_enabled_if_extra_time_is_enabled(live_game):
     assert live_game.possible_penalties is True
 
 
-def test_game_breaks_in_half_time(live_game):
-    live_game.no_break = False
-    assert live_game.state.status == SimulationStatus.NOT_STARTED
-    live_game.run()
-    assert live_game.minutes == timedelta(seconds=2700)
-    assert live_game.state.status == SimulationStatus.FIRST_HALF_BREAK
-    assert live_game.is_game_over is False
-
-
 def test_game_ends_after_90_minutes(live_game):
     assert live_game.state.status == SimulationStatus.NOT_STARTED
     live_game.run()
@@ -51,44 +46,21 @@ def test_game_ends_after_90_minutes(live_game):
     assert live_game.state.status == SimulationStatus.FINISHED
 
 
-def test_game_breaks_in_extra_time(live_game):
+def test_game_breaks_between_periods(live_game):
     live_game.no_break = False
     live_game.possible_extra_time = True
     assert live_game.state.status == SimulationStatus.NOT_STARTED
-    live_game.run()
-    assert live_game.state.status == SimulationStatus.FIRST_HALF_BREAK
-    live_game.run()
-    assert live_game.state.status == SimulationStatus.SECOND_HALF_BREAK
-    assert live_game.minutes == timedelta(minutes=90)
-    assert live_game.is_game_over is False
-
-
-def test_game_breaks_in_extra_time_half_time(live_game):
-    live_game.no_break = False
-    live_game.possible_extra_time = True
-    live_game.run()  # first half
-    assert live_game.state.status == SimulationStatus.FIRST_HALF_BREAK
-    live_game.run()  # second half
-    assert live_game.state.status == SimulationStatus.SECOND_HALF_BREAK
-    live_game.run()  # first et half
-    assert live_game.state.status == SimulationStatus.FIRST_HALF_EXTRA_TIME_BREAK
-    assert live_game.minutes == timedelta(minutes=105)
-    assert live_game.is_game_over is False
-
-
-def test_game_breaks_to_penalty_shootout(live_game):
-    live_game.no_break = False
-    live_game.possible_extra_time = True
-    live_game.run()  # first half
-    assert live_game.state.status == SimulationStatus.FIRST_HALF_BREAK
-    live_game.run()  # second half
-    assert live_game.state.status == SimulationStatus.SECOND_HALF_BREAK
-    live_game.run()  # first et half
-    assert live_game.state.status == SimulationStatus.FIRST_HALF_EXTRA_TIME_BREAK
-    live_game.run()  # second et half
-    assert live_game.state.status == SimulationStatus.SECOND_HALF_EXTRA_TIME_BREAK
-    assert live_game.minutes == timedelta(minutes=120)
-    assert live_game.is_game_over is False
+    breaks = [
+        (SimulationStatus.FIRST_HALF_BREAK, timedelta(minutes=45)),
+        (SimulationStatus.SECOND_HALF_BREAK, timedelta(minutes=90)),
+        (SimulationStatus.FIRST_HALF_EXTRA_TIME_BREAK, timedelta(minutes=105)),
+        (SimulationStatus.SECOND_HALF_EXTRA_TIME_BREAK, timedelta(minutes=120)),
+    ]
+    for expected_status, expected_minutes in breaks:
+        live_game.run()
+        assert live_game.state.status == expected_status
+        assert live_game.minutes == expected_minutes
+        assert live_game.is_game_over is False
 
 
 def test_game_breaks_and_does_not_go_to_extra_time(live_game, player_sim):
@@ -119,87 +91,56 @@ def test_game_ends_in_120_minutes(live_game, player_sim):
     assert live_game.is_game_over is True
 
 
-def test_game_starts_with_pass_event(live_game):
+@pytest.mark.parametrize(
+    "minutes,status,has_last_event",
+    [
+        (0, SimulationStatus.NOT_STARTED, False),
+        (45, SimulationStatus.FIRST_HALF_BREAK, True),
+        (90, SimulationStatus.SECOND_HALF_BREAK, True),
+        (105, SimulationStatus.FIRST_HALF_EXTRA_TIME_BREAK, True),
+    ],
+)
+def test_period_starts_with_pass_event(
+    simulation_teams, minutes, status, has_last_event
+):
     event_factory = EventFactory()
     game_state = GameState(
-        timedelta(minutes=0),
-        SimulationStatus.NOT_STARTED,
+        timedelta(minutes=minutes),
+        status,
         PitchPosition.MIDFIELD_CENTER,
     )
-    event = event_factory.get_event_type(
-        (live_game.engine.home_team, live_game.engine.away_team),
-        game_state,
-        None,
-    )
+    last_event = PassEvent(EventType.PASS, game_state) if has_last_event else None
+    event = event_factory.get_event_type(simulation_teams, game_state, last_event)
     assert event == EventType.PASS
 
 
-def test_half_time_starts_with_pass_event(live_game):
-    event_factory = EventFactory()
+def test_get_added_time_in_45_minutes():
     game_state = GameState(
         timedelta(minutes=45),
-        SimulationStatus.FIRST_HALF_BREAK,
-        PitchPosition.MIDFIELD_CENTER,
-    )
-    event = event_factory.get_event_type(
-        (live_game.engine.home_team, live_game.engine.away_team),
-        game_state,
-        PassEvent(EventType.PASS, game_state),
-    )
-    assert event == EventType.PASS
-
-
-def test_extra_time_starts_with_pass_event(live_game):
-    event_factory = EventFactory()
-    game_state = GameState(
-        timedelta(minutes=90),
-        SimulationStatus.SECOND_HALF_BREAK,
-        PitchPosition.MIDFIELD_CENTER,
-    )
-    event = event_factory.get_event_type(
-        (live_game.engine.home_team, live_game.engine.away_team),
-        game_state,
-        PassEvent(EventType.PASS, game_state),
-    )
-    assert event == EventType.PASS
-
-
-def test_extra_half_time_starts_with_pass_event(live_game):
-    event_factory = EventFactory()
-    game_state = GameState(
-        timedelta(minutes=105),
-        SimulationStatus.FIRST_HALF_EXTRA_TIME_BREAK,
+        SimulationStatus.FIRST_HALF,
         PitchPosition.MIDFIELD_CENTER,
     )
-    event = event_factory.get_event_type(
-        (live_game.engine.home_team, live_game.engine.away_team),
-        game_state,
-        PassEvent(EventType.PASS, game_state),
-    )
-    assert event == EventType.PASS
+    original_state = copy(game_state)
+    added_time = calculate_added_time(game_state, random.Random(0))
+    assert game_state == original_state
+    assert added_time == timedelta(minutes=3)
 
 
-def test_get_added_time_in_45_minutes(live_game):
-    game_state = GameState(
-        timedelta(minutes=45),
-        SimulationStatus.FIRST_HALF,
-        PitchPosition.MIDFIELD_CENTER,
-    )
-    live_game.state = game_state
+def test_live_game_get_added_time_marks_additional_time(live_game):
+    live_game.state.minutes = timedelta(minutes=45)
+    live_game.state.status = SimulationStatus.FIRST_HALF
     live_game.get_added_time()
     assert live_game.state.in_additional_time is True
-    assert live_game.state.minutes == timedelta(minutes=45)
     assert live_game.added_time is not None
 
 
-def test_get_added_time_before_45_minutes(live_game):
+def test_get_added_time_before_45_minutes():
     game_state = GameState(
         timedelta(minutes=44),
         SimulationStatus.FIRST_HALF,
         PitchPosition.MIDFIELD_CENTER,
     )
-    live_game.state = game_state
-    live_game.get_added_time()
-    assert live_game.state.in_additional_time is False
-    assert live_game.state.minutes == timedelta(minutes=44)
-    assert live_game.added_time is None
+    original_state = copy(game_state)
+    added_time = calculate_added_time(game_state, random.Random(0))
+    assert game_state == original_state
+    assert added_time is None